@@ -6,6 +6,8 @@ from pygame.math import Vector2
 class Entity(Sprite):
     """Base class for game objects."""
 
+    __slots__ = ("image", "rect")
+
     def __init__(self, image: pygame.Surface, rect: pygame.Rect):
         """Initialize the entity object.
 
@@ -39,6 +41,8 @@ class Entity(Sprite):
 class MovableEntity(Entity):
     """Base class for movable entities."""
 
+    __slots__ = ("speed",)
+
     def __init__(self, image: pygame.Surface, rect: pygame.Rect, speed: Vector2):
         """Initialize the movable entity object.
 
@@ -58,10 +62,20 @@ class MovableEntity(Entity):
         """Move the entity."""
         self.rect.move_ip(self.speed.x, self.speed.y)
 
+    def flip_speed_x(self):
+        """Invert the horizontal speed of the entity."""
+        self.speed.x = -self.speed.x
+
+    def flip_speed_y(self):
+        """Invert the vertical speed of the entity."""
+        self.speed.y = -self.speed.y
+
 
 class Block(Entity):
     """Class for destroyable blocks."""
 
+    __slots__ = ("destroyed",)
+
     def __init__(self, image: pygame.Surface, rect: pygame.Rect):
         """Initialize the block object.
 
@@ -73,25 +87,20 @@ class Block(Entity):
             The rectangle that contains position and borders of the block.
         """
         super().__init__(image, rect)
-        self.__is_destroyed = False
+        self.destroyed = False
 
-    def is_destroyed(self) -> bool:
-        """Return whether the block is destroyed or not.
-
-        Returns
-        -------
-        bool
-            Returns True if the block is destroyed, False otherwise.
-        """
-        return self.__is_destroyed
 
-    def set_is_destroyed(self):
-        """Mark the block as destroyed."""
-        self.__is_destroyed = True
+class Ball(MovableEntity):
+    """Class for ball entity.
 
+    Note: The speed is stored internally as fixed-point integers with 8
+    fractional bits, and the whole-pixel per-frame deltas are cached in the
+    plain int attributes `vx` and `vy`, so the per-frame movement touches no
+    Vector2 at all; the `speed` property keeps the Vector2 interface of
+    MovableEntity.
+    """
 
-class Ball(MovableEntity):
-    """Class for ball entity."""
+    __slots__ = ("__vx256", "__vy256", "vx", "vy")
 
     def __init__(self, image: pygame.Surface, rect: pygame.Rect, speed: Vector2):
         """Initialize the ball object.
@@ -107,6 +116,40 @@ class Ball(MovableEntity):
         """
         super().__init__(image, rect, speed)
 
+    @property
+    def speed(self) -> Vector2:
+        """Vector2: The speed vector of the ball.
+
+        Assigned vectors are stored in the fixed-point representation, so
+        change the speed by assigning a new vector or through the
+        `flip_speed_x` / `flip_speed_y` methods, not through `speed.x`.
+        """
+        return Vector2(self.__vx256 / 256, self.__vy256 / 256)
+
+    @speed.setter
+    def speed(self, speed: Vector2):
+        self.__vx256 = round(speed.x * 256)
+        self.__vy256 = round(speed.y * 256)
+        # adding half before the shift rounds the delta to the nearest pixel,
+        # matching what adding a float speed to the integer rect coordinate
+        # does
+        self.vx = (self.__vx256 + 128) >> 8
+        self.vy = (self.__vy256 + 128) >> 8
+
+    def flip_speed_x(self):
+        """Invert the horizontal speed of the ball."""
+        self.__vx256 = -self.__vx256
+        self.vx = (self.__vx256 + 128) >> 8
+
+    def flip_speed_y(self):
+        """Invert the vertical speed of the ball."""
+        self.__vy256 = -self.__vy256
+        self.vy = (self.__vy256 + 128) >> 8
+
+    def move(self):
+        """Move the ball."""
+        self.rect.move_ip(self.vx, self.vy)
+
 
 class Platform(MovableEntity):
     """Class for platform entity.
@@ -114,6 +157,8 @@ class Platform(MovableEntity):
     Note: Platform moves only left or right, so vertical speed is ignored.
     """
 
+    __slots__ = ()
+
     def __init__(self, image: pygame.Surface, rect: pygame.Rect, speed: Vector2):
         """Initialize the platform object.
 
@@ -151,7 +196,7 @@ def adjust_on_x_collision(movable_entity: MovableEntity, entity: Entity) -> None
     else:
         movable_entity.rect.left = entity.rect.right
 
-    movable_entity.speed.x = -movable_entity.speed.x
+    movable_entity.flip_speed_x()
 
 
 def adjust_on_y_collision(movable_entity: MovableEntity, entity: Entity) -> None:
@@ -172,4 +217,4 @@ def adjust_on_y_collision(movable_entity: MovableEntity, entity: Entity) -> None
     else:
         movable_entity.rect.top = entity.rect.bottom
 
-    movable_entity.speed.y = -movable_entity.speed.y
+    movable_entity.flip_speed_y()
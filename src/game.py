@@ -104,9 +104,16 @@ class Game:
             os.path.join(os.getcwd(), "assets", "font.ttf"), 20
         )
 
+        # Label and delimiter areas drawn on the previous frame that have to be
+        # erased on the next one, and whether the whole screen must be
+        # repainted (first frame and after the menu was shown over the game
+        # area).
+        self.__dirty_rects: List[pygame.Rect] = []
+        self.__needs_full_redraw: bool = True
+
     def __draw(
         self,
-        sprites_group: pygame.sprite.Group,
+        lvl: level.Level,
         labels: List[helpers.Label],
         y_of_delimiter: int,
     ):
@@ -114,9 +121,9 @@ class Game:
 
         Parameters
         ----------
-        sprites_group : pygame.sprite.Group
-            Game objects that need to be drawn. Pass `None` if no sprites
-            needed to be drawn.
+        lvl : level.Level
+            Level whose objects need to be drawn. Pass `None` if no level
+            objects needed to be drawn.
         labels : List[helpers.Label]
             Text label that needs to be drawn.
         y_of_delimiter : int
@@ -124,12 +131,67 @@ class Game:
             game counters.
         """
 
-        self.__screen.fill(self.__background_color)
-        if sprites_group:
-            sprites_group.draw(self.__screen)
+        is_full_redraw = self.__needs_full_redraw
+        if is_full_redraw:
+            self.__screen.fill(self.__background_color)
+            self.__needs_full_redraw = False
+        else:
+            for rect in self.__dirty_rects:
+                self.__screen.fill(self.__background_color, rect)
+
+        dirty_rects = self.__dirty_rects
+        self.__dirty_rects = []
+
+        if lvl:
+            for rect in lvl.get_erase_rects():
+                self.__screen.fill(self.__background_color, rect)
+                dirty_rects.append(rect)
+            # one batched C call instead of a Python-level blit per sprite
+            dirty_rects += self.__screen.blits(lvl.get_draw_batch())
 
         for label in labels:
-            self.__screen.blit(*label.get_rendered())
+            image, rect = label.get_rendered()
+            self.__screen.blit(image, rect)
+            self.__dirty_rects.append(pygame.Rect(rect))
+
+        self.__dirty_rects.append(
+            pygame.draw.line(
+                self.__screen,
+                self.__accent_color,
+                (0, y_of_delimiter),
+                (self.__edges.width, y_of_delimiter),
+            )
+        )
+
+        if is_full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects + self.__dirty_rects)
+
+    def __draw_menu(
+        self,
+        menu_surface: pygame.Surface,
+        position: tuple,
+        y_of_delimiter: int,
+    ):
+        """Draw the pre-rendered menu surface.
+
+        Parameters
+        ----------
+        menu_surface : pygame.Surface
+            Surface with the whole menu text composed onto it.
+        position : tuple[int, int]
+            Position of the top left corner of the menu surface.
+        y_of_delimiter : int
+            Says where on Y axis to draw the line that delimiters game area and
+            game counters.
+        """
+
+        self.__screen.fill(self.__background_color)
+        self.__screen.blit(menu_surface, position)
+        # the menu paints over the game area, so the next game frame has to
+        # repaint the whole screen
+        self.__needs_full_redraw = True
 
         pygame.draw.line(
             self.__screen,
@@ -146,12 +208,16 @@ class Game:
         color: tuple,
         menu_text: str,
         start_position: Vector2,
-    ) -> List[helpers.Label]:
-        """Renders text label of the start / pause game menu text.
+    ) -> tuple[pygame.Surface, tuple]:
+        """Render the start / pause game menu text onto one surface.
+
+        All text lines are composed onto a single surface once, so showing the
+        menu takes one blit per frame instead of one per line.
 
         Returns
         -------
-        List[helpers.Label]
+        tuple[pygame.Surface, tuple[int, int]]
+            The composed menu surface and the position of its top left corner.
         """
 
         menu_labels = []
@@ -159,7 +225,17 @@ class Game:
             menu_labels.append(helpers.Label(font, start_position, line, color))
             start_position += (0, menu_labels[-1].get_rendered()[1].height)
 
-        return menu_labels
+        bounds = (
+            menu_labels[0]
+            .get_rendered()[1]
+            .unionall([label.get_rendered()[1] for label in menu_labels[1:]])
+        )
+        menu_surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for label in menu_labels:
+            image, rect = label.get_rendered()
+            menu_surface.blit(image, (rect.x - bounds.x, rect.y - bounds.y))
+
+        return (menu_surface, bounds.topleft)
 
     def run(self):
         """Run the game application."""
@@ -206,7 +282,7 @@ class Game:
             "Press ALT to set the game with hardcore mode[1 life]\n"
             "Press F1 to play or stop music"
         )
-        menu_labels = Game.__render_menu(
+        menu_surface, menu_position = Game.__render_menu(
             self.__font,
             self.__accent_color,
             menu_text,
@@ -239,6 +315,9 @@ class Game:
                         lvl = self.__level_maker.get_level(lifes=1)
                         is_paused = not is_paused
                         is_menu_showing = False
+                        # a fresh level brings back all blocks, so the screen
+                        # content is stale
+                        self.__needs_full_redraw = True
                     if event.key == pygame.K_F1:
                         is_music_paused = not is_music_paused
                         if is_music_paused:
@@ -246,23 +325,27 @@ class Game:
                         else:
                             self.music.play(-1)
 
-            score_count.set_text(f"Score: {lvl.get_game_state().score}")
-            lifes_count.set_text(f"Lifes: {lvl.get_game_state().lifes}")
+            state = lvl.get_game_state()
 
             labels = [score_count, lifes_count]
 
-            if lvl.get_game_state().is_game_over:
+            if state.is_game_over:
                 labels.append(game_over_label)
 
-            elif lvl.get_game_state().is_player_won:
+            elif state.is_player_won:
                 labels.append(victory_label)
-            elif not is_paused:
-                lvl.update()
+            else:
+                # the level is still being played; on the frozen end screens
+                # updating the level and the counters would be redundant work
+                if not is_paused:
+                    lvl.update()
+                score_count.set_text(f"Score: {state.score}")
+                lifes_count.set_text(f"Lifes: {state.lifes}")
 
             if is_menu_showing or is_paused:
-                self.__draw(None, menu_labels, lvl.get_top_edge())
+                self.__draw_menu(menu_surface, menu_position, lvl.get_top_edge())
             else:
-                self.__draw(lvl.get_sprites_group(), labels, lvl.get_top_edge())
+                self.__draw(lvl, labels, lvl.get_top_edge())
 
             clock.tick(60)
 
@@ -58,12 +58,18 @@ class Label:
     def set_text(self, text: str):
         """Update text of the label and update its rendered image and placement rectangle.
 
+        Does nothing when the text is unchanged, so callers may set the same
+        text every frame without paying for font rendering again.
+
         Parameters
         ----------
         text : str
             New text for the label.
         """
 
+        if text == self.__text:
+            return
+
         self.__text = text
         self.__render()
 
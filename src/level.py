@@ -1,11 +1,139 @@
 """Create and manage level."""
 
 from dataclasses import dataclass
-import copy
 import pygame
 import entity
 import helpers
-from typing import List
+from typing import List, Optional
+
+# Key codes cached at module scope so the per-frame key handling does not
+# repeat the attribute lookups on the pygame module.
+_K_LCTRL = pygame.K_LCTRL
+_K_RCTRL = pygame.K_RCTRL
+_K_A = pygame.K_a
+_K_D = pygame.K_d
+
+
+def _edge_overshoot(low: int, low_bound: int, high: int, high_bound: int) -> int:
+    """Return how far the span [low, high] must be shifted to stay in bounds.
+
+    Computed with plain arithmetic instead of separate branches per side:
+    positive when the span sticks out of the low bound, negative when it
+    sticks out of the high bound, 0 when it lies inside.
+
+    Parameters:
+        low (int): Low coordinate of the span.
+        low_bound (int): Low bound of the allowed range.
+        high (int): High coordinate of the span.
+        high_bound (int): High bound of the allowed range.
+
+    Returns:
+        int: The shift to add to the span position.
+    """
+    return max(0, low_bound - low) - max(0, high - high_bound)
+
+
+class BVH:
+    """Bounding volume hierarchy of axis-aligned rectangles.
+
+    Rectangles are inserted with an integer id and kept in a binary tree whose
+    inner nodes store the union rectangle of their subtrees, so a point or
+    rectangle query only descends into subtrees it actually overlaps —
+    O(log N) on average instead of scanning every rectangle.
+    """
+
+    class _Node:
+        """Tree node. Leaf nodes carry an id, inner nodes carry two children."""
+
+        def __init__(self, box: pygame.Rect, id: Optional[int] = None):
+            self.box = box
+            self.id = id
+            self.left: Optional["BVH._Node"] = None
+            self.right: Optional["BVH._Node"] = None
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self.__root: Optional[BVH._Node] = None
+
+    def insert(self, rect: pygame.Rect, id: int) -> None:
+        """Insert a rectangle with the given id.
+
+        The insertion descends into the child whose bounding box grows the
+        least when united with the new rectangle, keeping the tree boxes tight.
+
+        Parameters:
+            rect (pygame.Rect): The rectangle to insert.
+            id (int): Identifier returned by `query` for this rectangle.
+        """
+        leaf = BVH._Node(pygame.Rect(rect), id)
+        if self.__root is None:
+            self.__root = leaf
+        else:
+            self.__root = BVH.__insert(self.__root, leaf)
+
+    @staticmethod
+    def __insert(node: "BVH._Node", leaf: "BVH._Node") -> "BVH._Node":
+        """Insert the leaf into the subtree and return its new root."""
+        if node.id is not None:
+            parent = BVH._Node(node.box.union(leaf.box))
+            parent.left = node
+            parent.right = leaf
+            return parent
+
+        def grown_area(box: pygame.Rect) -> int:
+            union = box.union(leaf.box)
+            return union.width * union.height - box.width * box.height
+
+        node.box.union_ip(leaf.box)
+        if grown_area(node.left.box) <= grown_area(node.right.box):
+            node.left = BVH.__insert(node.left, leaf)
+        else:
+            node.right = BVH.__insert(node.right, leaf)
+        return node
+
+    def remove(self, id: int) -> None:
+        """Remove the rectangle with the given id, if present.
+
+        Parameters:
+            id (int): Identifier the rectangle was inserted with.
+        """
+        if self.__root is not None:
+            self.__root = BVH.__remove(self.__root, id)
+
+    @staticmethod
+    def __remove(node: "BVH._Node", id: int) -> Optional["BVH._Node"]:
+        """Remove the leaf with the id from the subtree and return its new root."""
+        if node.id is not None:
+            return None if node.id == id else node
+        node.left = BVH.__remove(node.left, id)
+        if node.left is None:
+            return node.right
+        node.right = BVH.__remove(node.right, id)
+        if node.right is None:
+            return node.left
+        return node
+
+    def query(self, rect: pygame.Rect) -> Optional[int]:
+        """Find a stored rectangle overlapping the given one.
+
+        Parameters:
+            rect (pygame.Rect): The rectangle to test against the tree.
+
+        Returns:
+            Optional[int]: Id of an overlapping rectangle, or None if there is
+                no overlap.
+        """
+        if self.__root is None:
+            return None
+        stack = [self.__root]
+        while stack:
+            node = stack.pop()
+            if node.box.colliderect(rect):
+                if node.id is not None:
+                    return node.id
+                stack.append(node.left)
+                stack.append(node.right)
+        return None
 
 
 class Level:
@@ -19,6 +147,14 @@ class Level:
             position is ignored.
         __edges (pygame.Rect): Rectangle that contains width and height of the level.
         __state (Level.GameState): Game state of the level.
+        __block_index (tuple[entity.Block]): All blocks of the level in creation order.
+            Unlike `__blocks` it is never mutated, so ids stored in the BVH
+            always map back to their block objects.
+        __bvh (BVH): Bounding volume hierarchy of the surviving block rectangles.
+        __draw_batch (List[tuple]): (image, rect) pairs of the surviving level
+            objects, ready for one batched pygame.Surface.blits call.
+        __erase_rects (List[pygame.Rect]): Screen areas vacated since the start
+            of the last update.
     """
 
     @dataclass
@@ -65,10 +201,18 @@ class Level:
         self.__platform = platform
         self.__ball = ball
 
+        self.__block_index = tuple(blocks)
+        self.__bvh = BVH()
+        for i, block in enumerate(blocks):
+            self.__bvh.insert(block.rect, i)
+
+        self.__build_draw_batch()
+        self.__erase_rects: List[pygame.Rect] = []
+
         self.__edges = pygame.Rect((0, top_start), (edges.width, edges.height))
 
         self.__state = Level.GameState(
-            ball_released_speed=copy.deepcopy(self.__ball.speed), lifes=lifes
+            ball_released_speed=pygame.math.Vector2(self.__ball.speed), lifes=lifes
         )
 
         self.__reset_ball()
@@ -92,7 +236,7 @@ class Level:
         """Release the ball from the platform."""
         if not self.__state.is_ball_released:
             self.__state.is_ball_released = True
-            self.__ball.speed = copy.deepcopy(self.__state.ball_released_speed)
+            self.__ball.speed = pygame.math.Vector2(self.__state.ball_released_speed)
 
     def get_game_state(self) -> GameState:
         """Return game state of the level.
@@ -102,101 +246,148 @@ class Level:
         """
         return self.__state
 
-    def get_sprites_group(self) -> pygame.sprite.Group:
-        """Return game objects as one group.
+    def __build_draw_batch(self) -> None:
+        """Rebuild the (image, rect) draw batch from the surviving objects."""
+        self.__draw_batch = [(block.image, block.rect) for block in self.__blocks]
+        self.__draw_batch.append((self.__platform.image, self.__platform.rect))
+        self.__draw_batch.append((self.__ball.image, self.__ball.rect))
+
+    def get_draw_batch(self) -> List[tuple]:
+        """Return (image, rect) pairs of all surviving level objects.
+
+        The rects are the live object rects, so the batch stays current as
+        objects move and only has to be rebuilt when blocks are destroyed.
 
         Returns:
-            pygame.sprite.Group: The group containing all game objects.
+            List[tuple[pygame.Surface, pygame.Rect]]: Pairs to pass to one
+                batched pygame.Surface.blits call.
         """
-        return pygame.sprite.Group(self.__platform, self.__ball, *self.__blocks)
+        return self.__draw_batch
 
-    def __process_key_presses(self) -> None:
-        """Process key presses and update level objects and state correspondingly."""
+    def get_erase_rects(self) -> List[pygame.Rect]:
+        """Return screen areas vacated since the start of the last update.
+
+        Covers the previous positions of the movable objects and the
+        rectangles of blocks destroyed by the last update.
 
-        def do_update() -> None:
-            self.__platform.move()
-            if not self.__state.is_ball_released:
-                self.__ball.rect.bottom = self.__platform.rect.top
-                self.__ball.rect.centerx = self.__platform.rect.centerx
+        Returns:
+            List[pygame.Rect]: The areas to clear before drawing the batch.
+        """
+        return self.__erase_rects
+
+    def __move_platform(self) -> None:
+        """Move the platform and keep the not yet released ball tied to it."""
+        self.__platform.move()
+        if not self.__state.is_ball_released:
+            self.__ball.rect.bottom = self.__platform.rect.top
+            self.__ball.rect.centerx = self.__platform.rect.centerx
 
+    def __process_key_presses(self) -> None:
+        """Process key presses and update level objects and state correspondingly."""
         keys = pygame.key.get_pressed()
 
-        if keys[pygame.K_LCTRL] or keys[pygame.K_RCTRL]:
+        if keys[_K_LCTRL] or keys[_K_RCTRL]:
             self.release_ball()
-        if keys[pygame.K_a]:
+        if keys[_K_A]:
             self.__platform.speed.x = -abs(self.__platform.speed.x)
-            do_update()
-        if keys[pygame.K_d]:
+            self.__move_platform()
+        if keys[_K_D]:
             self.__platform.speed.x = abs(self.__platform.speed.x)
-            do_update()
+            self.__move_platform()
 
     def __process_collisions(self) -> None:
         """Process collisions and update objects positions and speeds."""
-        # Checking collision on the X axis
-        self.__ball.rect.x += self.__ball.speed.x
-        if self.__ball.is_collided_with(self.__platform):
-            entity.adjust_on_x_collision(self.__ball, self.__platform)
+        # Everything touched repeatedly below is bound to locals first: the
+        # method runs every frame and each self.<attr>.<attr> chain costs two
+        # lookups per use. The collision tests use Rect.colliderect directly
+        # instead of entity.Entity.is_collided_with to avoid the extra call
+        # dispatch; the method stays for external callers.
+        ball = self.__ball
+        platform = self.__platform
+        edges = self.__edges
+        bvh = self.__bvh
+        block_index = self.__block_index
+        ball_rect = ball.rect
+        platform_rect = platform.rect
 
-        elif self.__ball.rect.right > self.__edges.right:
-            self.__ball.rect.right = self.__edges.right
-            self.__ball.speed.x = -self.__ball.speed.x
+        # Checking collision on the X axis
+        ball_rect.x += ball.vx
+        if ball_rect.colliderect(platform_rect):
+            entity.adjust_on_x_collision(ball, platform)
 
-        elif self.__ball.rect.left < self.__edges.left:
-            self.__ball.rect.left = self.__edges.left
-            self.__ball.speed.x = -self.__ball.speed.x
         else:
-            for block in self.__blocks:
-                if self.__ball.is_collided_with(block):
-                    entity.adjust_on_x_collision(self.__ball, block)
-                    block.set_is_destroyed()
+            shift = _edge_overshoot(
+                ball_rect.left, edges.left, ball_rect.right, edges.right
+            )
+            if shift != 0:
+                ball_rect.x += shift
+                ball.flip_speed_x()
+            else:
+                hit = bvh.query(ball_rect)
+                if hit is not None:
+                    block = block_index[hit]
+                    entity.adjust_on_x_collision(ball, block)
+                    block.destroyed = True
+                    bvh.remove(hit)
 
         # Checking collision on the Y axis
-        self.__ball.rect.y += self.__ball.speed.y
-        if self.__ball.is_collided_with(self.__platform):
-            entity.adjust_on_y_collision(self.__ball, self.__platform)
+        ball_rect.y += ball.vy
+        if ball_rect.colliderect(platform_rect):
+            entity.adjust_on_y_collision(ball, platform)
 
-        elif self.__ball.rect.bottom > self.__edges.bottom:
+        elif ball_rect.bottom > edges.bottom:
             self.__reset_ball()
             self.__state.lifes -= 1
 
-        elif self.__ball.rect.top < self.__edges.top:
-            self.__ball.rect.top = self.__edges.top
-            self.__ball.speed.y = -self.__ball.speed.y
         else:
-            for block in self.__blocks:
-                if self.__ball.is_collided_with(block):
-                    entity.adjust_on_y_collision(self.__ball, block)
-                    block.set_is_destroyed()
+            # falling out of the bottom edge is handled above, so only the
+            # top edge can overshoot here
+            shift = _edge_overshoot(
+                ball_rect.top, edges.top, ball_rect.bottom, edges.bottom
+            )
+            if shift != 0:
+                ball_rect.y += shift
+                ball.flip_speed_y()
+            else:
+                hit = bvh.query(ball_rect)
+                if hit is not None:
+                    block = block_index[hit]
+                    entity.adjust_on_y_collision(ball, block)
+                    block.destroyed = True
+                    bvh.remove(hit)
 
         is_squeezing_on_y = (
-            self.__ball.rect.bottom < self.__platform.rect.top
-            or self.__ball.rect.top < self.__platform.rect.bottom
-        )
-        is_squeezing_on_x = (
-            self.__ball.rect.right > self.__edges.right
-            or self.__ball.rect.left < self.__edges.left
+            ball_rect.bottom < platform_rect.top or ball_rect.top < platform_rect.bottom
         )
+        is_squeezing_on_x = ball_rect.right > edges.right or ball_rect.left < edges.left
         if is_squeezing_on_y and is_squeezing_on_x:
-            self.__ball.rect.top = self.__platform.rect.bottom
+            ball_rect.top = platform_rect.bottom
 
-        if self.__platform.rect.right > self.__edges.right:
-            self.__platform.rect.right = self.__edges.right
-            self.__platform.speed.x = -self.__platform.speed.x
+        if platform_rect.right > edges.right:
+            platform_rect.right = edges.right
+            platform.speed.x = -platform.speed.x
 
-        elif self.__platform.rect.left < self.__edges.left:
-            self.__platform.rect.left = self.__edges.left
-            self.__platform.speed.x = -self.__platform.speed.x
+        elif platform_rect.left < edges.left:
+            platform_rect.left = edges.left
+            platform.speed.x = -platform.speed.x
 
     def update(self) -> None:
         """Do updates of the level's state and objects."""
+        self.__erase_rects = [
+            pygame.Rect(self.__ball.rect),
+            pygame.Rect(self.__platform.rect),
+        ]
+
         self.__process_key_presses()
         self.__process_collisions()
 
-        for block in self.__blocks:
-            if block.is_destroyed():
-                self.__blocks.remove(block)
-                self.__state.score += 100
-                self.__ball.speed *= 1.02
+        destroyed = [block for block in self.__blocks if block.destroyed]
+        if destroyed:
+            self.__blocks = [block for block in self.__blocks if not block.destroyed]
+            self.__erase_rects += [pygame.Rect(block.rect) for block in destroyed]
+            self.__build_draw_batch()
+            self.__state.score += 100 * len(destroyed)
+            self.__ball.speed *= 1.02 ** len(destroyed)
 
         if self.__state.lifes < 1:
             self.__state.is_game_over = True
@@ -273,22 +464,27 @@ class LevelMaker:
             (0, 0, 255),  # Blue
             (128, 0, 200),  # Violet
         ]
+        block_image = self.__images["block"]
+        block_size = block_image.get_size()
+        block_width = block_size[0]
+
         colored_block_images = []
         for color in rainbow_colors:
-            image = self.__images["block"].copy()
+            image = block_image.copy()
             image.fill(color, special_flags=pygame.BLEND_MULT)
             colored_block_images.append(image)
 
         blocks = []
         for i in range(0, self.__num_of_rows):
-            while x + self.__images["block"].get_size()[0] < self.__edges.width:
+            row_image = colored_block_images[i % len(colored_block_images)]
+            while x + block_width < self.__edges.width:
                 blocks.append(
                     entity.Block(
-                        image=colored_block_images[i % len(colored_block_images)],
-                        rect=pygame.Rect((x, y), self.__images["block"].get_size()),
+                        image=row_image,
+                        rect=pygame.Rect((x, y), block_size),
                     )
                 )
-                x += self.__images["block"].get_size()[0] + self.__horizontal_alignment
+                x += block_width + self.__horizontal_alignment
 
             x = self.__horizontal_alignment
             y += self.__vertical_alignment
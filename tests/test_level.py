@@ -21,6 +21,33 @@ def dummy_key_presses(monkeypatch):
     )
 
 
+def test_bvh_query_and_remove():
+    tested_bvh = level.BVH()
+    rects = [
+        pygame.Rect(0, 0, 10, 10),
+        pygame.Rect(20, 0, 10, 10),
+        pygame.Rect(40, 0, 10, 10),
+    ]
+    for i, rect in enumerate(rects):
+        tested_bvh.insert(rect, i)
+
+    # each rectangle is found by a query overlapping only it
+    for i, rect in enumerate(rects):
+        assert tested_bvh.query(rect) == i
+
+    # no overlap
+    assert tested_bvh.query(pygame.Rect(0, 30, 10, 10)) is None
+    # touching edges do not overlap
+    assert tested_bvh.query(pygame.Rect(10, 0, 10, 10)) is None
+    # partial overlap
+    assert tested_bvh.query(pygame.Rect(15, 0, 10, 10)) == 1
+
+    tested_bvh.remove(1)
+    assert tested_bvh.query(pygame.Rect(20, 0, 10, 10)) is None
+    assert tested_bvh.query(pygame.Rect(0, 0, 10, 10)) == 0
+    assert tested_bvh.query(pygame.Rect(40, 0, 10, 10)) == 2
+
+
 def test_release_ball():
     platform = entity.Platform(None, pygame.Rect(40, 50, 15, 5), pygame.Vector2(5, 0))
     ball = entity.Ball(None, pygame.Rect(5, 5, 10, 10), pygame.Vector2(10, 10))
@@ -127,12 +154,12 @@ def test_block_logic():
 
     previous_state = copy.deepcopy(tested_level.get_game_state())
 
-    assert not block.is_destroyed()
+    assert not block.destroyed
 
     tested_level.release_ball()
     tested_level.update()
 
-    assert block.is_destroyed()
+    assert block.destroyed
     assert tested_level.get_game_state().score > previous_state.score
     # if ball speed is increased
     assert abs(ball.speed.x) > abs(initial_ball_speed.x) and abs(ball.speed.y) > abs(